@@ -19,6 +19,13 @@ Quick Start:
     # Batch search
     batch = await serp.search_batch(["query1", "query2"])
 
+    # Share one connection pool across convenience calls
+    await serp.open_default_client()
+    try:
+        result = await serp.search("python tutorial")
+    finally:
+        await serp.aclose_default_client()
+
 Configuration via environment variables:
     export SERP_BRIGHT_DATA_API_KEY="your-api-key"
     export SERP_BRIGHT_DATA_ZONE="serp_api1"
@@ -26,7 +33,13 @@ Configuration via environment variables:
     export SERP_CACHE_TTL=3600
 """
 
-from .client import SerpAggregator, search, search_batch
+from .client import (
+    SerpAggregator,
+    aclose_default_client,
+    open_default_client,
+    search,
+    search_batch,
+)
 from .models import (
     BatchResult,
     BatchSearchParams,
@@ -80,6 +93,8 @@ __all__ = [
     "SerpAggregator",
     "search",
     "search_batch",
+    "open_default_client",
+    "aclose_default_client",
     # Models
     "SearchParams",
     "BatchSearchParams",
@@ -1,9 +1,16 @@
 """Bright Data SERP API client (internal implementation)."""
 
 import asyncio
-from urllib.parse import urlparse
+import sys
+from collections.abc import Awaitable, Callable
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any
+from urllib.parse import urlencode, urlparse, urlsplit, urlunsplit
 
 import aiohttp
+import orjson
 
 from ..exceptions import SerpAPIError, SerpRateLimitError, SerpTimeoutError
 from ..models import (
@@ -26,12 +33,73 @@ def extract_domain(url: str) -> str:
         return ""
 
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Statuses that no retry or later page can recover from (bad key or zone)
+_TERMINAL_STATUSES = frozenset({401, 403})
+
+
+@lru_cache(maxsize=4096)
+def _canon_url(url: str) -> str:
+    """
+    Canonical, interned form of a URL used as the deduplication key.
+
+    Lowercases scheme and host, drops default ports and trailing slashes,
+    so trivially different spellings of one URL collapse together.
+    """
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        netloc = (parts.hostname or "").lower()
+        if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+            netloc = f"{netloc}:{parts.port}"
+        path = parts.path.rstrip("/")
+        canon = urlunsplit((scheme, netloc, path, parts.query, parts.fragment))
+    except ValueError:
+        canon = url
+    return sys.intern(canon)
+
+
+@lru_cache(maxsize=4096)
+def _build_base_url(query: str, gl: str, hl: str) -> str:
+    """Google search URL for a query, without the per-page start offset."""
+    params = urlencode({"gl": gl, "hl": hl, "brd_json": "1", "q": query})
+    return f"https://www.google.com/search?{params}"
+
+
+def build_timeout(settings: SerpSettings) -> aiohttp.ClientTimeout:
+    """Request timeout used for every submit and poll request."""
+    return aiohttp.ClientTimeout(
+        total=settings.request_timeout,
+        sock_connect=settings.connect_timeout,
+        sock_read=settings.request_timeout,
+    )
+
+
+def _is_terminal(error: Exception | None) -> bool:
+    """Whether a page error means no further page can succeed."""
+    return isinstance(error, SerpAPIError) and error.is_terminal
+
+
+def _retrieve_outcome(future: asyncio.Future[Any]) -> None:
+    """
+    Mark a fire-and-forget future's outcome as retrieved.
+
+    A cancelled gather() finishes with CancelledError as its exception,
+    which asyncio would otherwise log as never retrieved.
+    """
+    if not future.cancelled():
+        future.exception()
+
+
 async def make_serp_request(
     session: aiohttp.ClientSession,
     settings: SerpSettings,
     query: str,
     start: int = 0,
     rate_limiter: RateLimiter | None = None,
+    timeout: aiohttp.ClientTimeout | None = None,
+    request_semaphore: asyncio.Semaphore | None = None,
 ) -> dict:
     """
     Make a single SERP request with retry logic.
@@ -42,6 +110,9 @@ async def make_serp_request(
         query: Search query string
         start: Pagination offset (0, 10, 20, ...)
         rate_limiter: Optional rate limiter
+        timeout: Shared request timeout (built from settings if omitted)
+        request_semaphore: Optional in-flight cap, taken only once the rate
+            limiter has admitted the attempt and released during backoff
 
     Returns:
         dict: API response with organic results
@@ -54,15 +125,12 @@ async def make_serp_request(
     if rate_limiter is None:
         rate_limiter = NullRateLimiter()
 
+    if timeout is None:
+        timeout = build_timeout(settings)
+
     # Build search URL
-    base_params = {
-        "gl": settings.default_country,
-        "hl": settings.default_language,
-        "brd_json": "1",
-    }
-    params = {**base_params, "q": query, "start": str(start)}
-    query_string = "&".join(f"{k}={v}" for k, v in params.items())
-    url = f"https://www.google.com/search?{query_string}"
+    base_url = _build_base_url(query, settings.default_country, settings.default_language)
+    url = f"{base_url}&start={start}"
 
     headers = {
         "Authorization": f"Bearer {settings.bright_data_api_key.get_secret_value()}",
@@ -70,72 +138,97 @@ async def make_serp_request(
     }
     body = {"zone": settings.bright_data_zone, "url": url, "format": "raw"}
 
-    for attempt in range(settings.max_retries + 1):
-        try:
-            # Apply rate limiting
-            await rate_limiter.acquire()
-
-            # Step 1: Submit request
-            async with session.post(
-                f"{settings.api_base_url}/serp/req",
-                headers=headers,
-                json=body,
-                timeout=aiohttp.ClientTimeout(total=settings.request_timeout),
-            ) as response:
-                if response.status == 429:
-                    await rate_limiter.on_rate_limit()
-                    raise SerpRateLimitError(
-                        "Rate limit exceeded on submit",
-                        status_code=429,
-                    )
-
-                data = await response.json()
-                response_id = data.get("response_id")
+    # Optional hook for limiters that hold a slot per attempt; an attempt
+    # cancelled mid-flight reports nothing else to give it back
+    on_cancel = getattr(rate_limiter, "on_cancel", None)
 
-                if not response_id:
-                    await rate_limiter.on_error()
-                    raise SerpAPIError(
-                        "No response_id returned from API",
-                        status_code=response.status,
-                    )
-
-            # Step 2: Poll for results
-            for poll_num in range(settings.max_polls):
-                await asyncio.sleep(settings.poll_interval)
+    for attempt in range(settings.max_retries + 1):
+        # Apply rate limiting. A request turned away by the circuit breaker
+        # never reached the API, so it must not be reported back as an error.
+        await rate_limiter.acquire()
 
-                async with session.get(
-                    f"{settings.api_base_url}/serp/get_result",
+        try:
+            # Hold an in-flight slot only while actually talking to the API
+            async with request_semaphore or nullcontext():
+                # Step 1: Submit request
+                async with session.post(
+                    f"{settings.api_base_url}/serp/req",
                     headers=headers,
-                    params={"response_id": response_id},
-                    timeout=aiohttp.ClientTimeout(total=settings.request_timeout),
-                ) as poll_response:
-                    if poll_response.status == 200:
-                        await rate_limiter.on_success()
-                        return await poll_response.json()
-
-                    elif poll_response.status == 429:
+                    json=body,
+                    timeout=timeout,
+                ) as response:
+                    if response.status == 429:
                         await rate_limiter.on_rate_limit()
                         raise SerpRateLimitError(
-                            "Rate limit exceeded during polling",
+                            "Rate limit exceeded on submit",
                             status_code=429,
-                            response_id=response_id,
                         )
 
-                    elif poll_response.status not in [102, 202]:
+                    if response.status in _TERMINAL_STATUSES:
                         await rate_limiter.on_error()
                         raise SerpAPIError(
-                            f"Unexpected status during polling: {poll_response.status}",
-                            status_code=poll_response.status,
-                            response_id=response_id,
+                            f"Request rejected on submit: {response.status}",
+                            status_code=response.status,
+                            is_terminal=True,
                         )
 
-            # Polling timeout
-            await rate_limiter.on_error()
-            raise SerpTimeoutError(
-                f"Polling timeout after {settings.max_polls} attempts",
-                response_id=response_id,
-                elapsed_seconds=settings.poll_interval * settings.max_polls,
-            )
+                    data = await response.json(loads=orjson.loads)
+                    response_id = data.get("response_id")
+
+                    if not response_id:
+                        await rate_limiter.on_error()
+                        raise SerpAPIError(
+                            "No response_id returned from API",
+                            status_code=response.status,
+                        )
+
+                # Step 2: Poll for results
+                for poll_num in range(settings.max_polls):
+                    await asyncio.sleep(settings.poll_interval)
+
+                    async with session.get(
+                        f"{settings.api_base_url}/serp/get_result",
+                        headers=headers,
+                        params={"response_id": response_id},
+                        timeout=timeout,
+                    ) as poll_response:
+                        if poll_response.status == 200:
+                            # Parse before reporting: a malformed body is
+                            # reported once, as an error, by the handler below
+                            result = await poll_response.json(loads=orjson.loads)
+                            await rate_limiter.on_success()
+                            return result
+
+                        elif poll_response.status == 429:
+                            await rate_limiter.on_rate_limit()
+                            raise SerpRateLimitError(
+                                "Rate limit exceeded during polling",
+                                status_code=429,
+                                response_id=response_id,
+                            )
+
+                        elif poll_response.status not in [102, 202]:
+                            await rate_limiter.on_error()
+                            raise SerpAPIError(
+                                f"Unexpected status during polling: {poll_response.status}",
+                                status_code=poll_response.status,
+                                response_id=response_id,
+                                is_terminal=poll_response.status in _TERMINAL_STATUSES,
+                            )
+
+                # Polling timeout
+                await rate_limiter.on_error()
+                raise SerpTimeoutError(
+                    f"Polling timeout after {settings.max_polls} attempts",
+                    response_id=response_id,
+                    elapsed_seconds=settings.poll_interval * settings.max_polls,
+                )
+
+        except asyncio.CancelledError:
+            # Early termination cancels the pages still in flight
+            if on_cancel is not None:
+                await on_cancel()
+            raise
 
         except asyncio.TimeoutError:
             await rate_limiter.on_error()
@@ -172,28 +265,32 @@ async def fetch_page(
     settings: SerpSettings,
     query: str,
     page: int,
-    semaphore: asyncio.Semaphore,
     rate_limiter: RateLimiter | None = None,
-) -> tuple[int, dict | None, str | None]:
+    timeout: aiohttp.ClientTimeout | None = None,
+    request_semaphore: asyncio.Semaphore | None = None,
+) -> tuple[int, dict[str, Any] | None, Exception | None]:
     """
-    Fetch a single page with semaphore control.
+    Fetch a single page.
+
+    Concurrency is bounded by the worker pool in fetch_all_pages().
 
     Returns:
-        tuple: (page_number, response_dict or None, error_message or None)
+        tuple: (page_number, response_dict or None, error or None)
     """
-    async with semaphore:
-        start = (page - 1) * 10
-        try:
-            response = await make_serp_request(
-                session=session,
-                settings=settings,
-                query=query,
-                start=start,
-                rate_limiter=rate_limiter,
-            )
-            return page, response, None
-        except Exception as e:
-            return page, None, str(e)
+    start = (page - 1) * 10
+    try:
+        response = await make_serp_request(
+            session=session,
+            settings=settings,
+            query=query,
+            start=start,
+            rate_limiter=rate_limiter,
+            timeout=timeout,
+            request_semaphore=request_semaphore,
+        )
+        return page, response, None
+    except Exception as e:
+        return page, None, e
 
 
 async def fetch_all_pages(
@@ -205,6 +302,9 @@ async def fetch_all_pages(
     progress: ProgressReporter | None = None,
     rate_limiter: RateLimiter | None = None,
     raw_collector: list[dict] | None = None,
+    on_page: Callable[[int, dict[str, Any]], Awaitable[None]] | None = None,
+    timeout: aiohttp.ClientTimeout | None = None,
+    request_semaphore: asyncio.Semaphore | None = None,
 ) -> SearchResult:
     """
     Fetch all pages for a query concurrently with deduplication.
@@ -221,9 +321,18 @@ async def fetch_all_pages(
         progress: Progress reporter
         rate_limiter: Rate limiter
         raw_collector: Optional list to collect raw API responses
+        on_page: Optional coroutine called with (page, response) as each
+            page completes, before the full result is aggregated
+        timeout: Shared request timeout (built from settings if omitted)
+        request_semaphore: Optional semaphore shared across queries to cap
+            in-flight requests process-wide
 
     Returns:
         SearchResult with deduplicated organic results and metadata
+
+    Raises:
+        ValueError: If concurrency is not positive
+        SerpAPIError: On a terminal error (e.g. rejected credentials)
     """
     if progress is None:
         progress = NullProgress()
@@ -235,10 +344,14 @@ async def fetch_all_pages(
 
     max_pages = max_pages or settings.default_max_pages
     concurrency = concurrency or settings.default_concurrency
+    if concurrency < 1:
+        # No worker would start and the consumer below would wait forever
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    if timeout is None:
+        timeout = build_timeout(settings)
 
     progress.on_query_start(query, max_pages)
 
-    semaphore = asyncio.Semaphore(concurrency)
     organic_by_url: dict[str, dict] = {}
     pagination_seen: set[str] = set()
     errors: list[str] = []
@@ -246,109 +359,155 @@ async def fetch_all_pages(
     consecutive_empty = 0
     pages_fetched = 0
 
-    # Create tasks for all pages
-    tasks = [
-        asyncio.create_task(
-            fetch_page(session, settings, query, page, semaphore, rate_limiter)
-        )
-        for page in range(1, max_pages + 1)
-    ]
-
-    # Process as they complete
-    for coro in asyncio.as_completed(tasks):
-        page, response, error = await coro
-        pages_fetched += 1
-
-        if error:
-            errors.append(f"Page {page}: {error}")
-            progress.on_error(query, error, page)
-            consecutive_empty += 1
-
-        elif response:
-            # Collect raw response if collector provided
-            if raw_collector is not None:
-                raw_collector.append(response)
-
-            # Capture first response metadata
-            if first_response is None:
-                first_response = response
-
-            # Process organic results with deduplication
-            organic = response.get("organic", [])
-
-            if organic:
-                consecutive_empty = 0
-                for result in organic:
-                    url = result.get("link", "")
-                    if not url:
-                        continue
-
-                    rank = result.get("rank", 0)
-
-                    if url not in organic_by_url:
-                        organic_by_url[url] = {
-                            "link": url,
-                            "rank": rank,
-                            "title": result.get("title", ""),
-                            "description": result.get("description"),
-                            "positions": [rank],
-                            "pages": [page],
-                        }
-                    else:
-                        organic_by_url[url]["positions"].append(rank)
-                        organic_by_url[url]["pages"].append(page)
-            else:
+    # Worker pool: each worker pulls page numbers until the queue is drained
+    # or early termination sets the stop flag, so no work is scheduled for
+    # pages past the stop point.
+    page_queue: asyncio.Queue[int] = asyncio.Queue()
+    for page in range(1, max_pages + 1):
+        page_queue.put_nowait(page)
+    result_queue: asyncio.Queue[tuple[int, dict[str, Any] | None, Exception | None]] = asyncio.Queue()
+    stop = asyncio.Event()
+
+    async def worker() -> None:
+        while not stop.is_set():
+            try:
+                page = page_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            item = await fetch_page(
+                session, settings, query, page, rate_limiter, timeout, request_semaphore
+            )
+            if _is_terminal(item[2]):
+                stop.set()
+            result_queue.put_nowait(item)
+
+    # One handle for the whole pool so early termination is a single cancel
+    workers = asyncio.gather(
+        *(worker() for _ in range(min(concurrency, max_pages))),
+        return_exceptions=True,
+    )
+    workers.add_done_callback(_retrieve_outcome)
+
+    try:
+        # Process as they complete
+        for _ in range(max_pages):
+            page, response, error = await result_queue.get()
+            pages_fetched += 1
+
+            if error:
+                # Every other page would fail the same way; the finally
+                # block below cancels the requests still in flight.
+                if _is_terminal(error):
+                    progress.on_error(query, str(error), page)
+                    raise error
+
+                errors.append(f"Page {page}: {error}")
+                progress.on_error(query, str(error), page)
                 consecutive_empty += 1
 
-            # Collect pagination
-            for pag in response.get("pagination", []):
-                if isinstance(pag, dict):
-                    pag_key = pag.get("page", "")
-                    if pag_key and pag_key not in pagination_seen:
-                        pagination_seen.add(pag_key)
-
-            progress.on_page_complete(
-                ProgressEvent(
-                    query=query,
-                    page=page,
-                    total_pages=max_pages,
-                    results_count=len(organic),
-                    status="complete" if organic else "empty",
+            elif response:
+                # Collect raw response if collector provided
+                if raw_collector is not None:
+                    raw_collector.append(response)
+
+                # Capture first response metadata
+                if first_response is None:
+                    first_response = response
+
+                # Process organic results with deduplication
+                organic = response.get("organic", [])
+
+                if organic:
+                    consecutive_empty = 0
+                    # A URL counts once per page, so each "pages" list
+                    # below stays duplicate-free.
+                    seen_this_page: set[str] = set()
+                    for result in organic:
+                        link = result.get("link", "")
+                        if not link:
+                            continue
+                        url = _canon_url(link)
+                        if url in seen_this_page:
+                            continue
+                        seen_this_page.add(url)
+
+                        rank = result.get("rank", 0)
+
+                        if url not in organic_by_url:
+                            organic_by_url[url] = {
+                                "link": link,
+                                "rank": rank,
+                                "title": result.get("title", ""),
+                                "description": result.get("description"),
+                                "positions": [rank],
+                                "pages": [page],
+                            }
+                        else:
+                            organic_by_url[url]["positions"].append(rank)
+                            organic_by_url[url]["pages"].append(page)
+                else:
+                    consecutive_empty += 1
+
+                # Collect pagination
+                for pag in response.get("pagination", []):
+                    if isinstance(pag, dict):
+                        pag_key = pag.get("page", "")
+                        if pag_key and pag_key not in pagination_seen:
+                            pagination_seen.add(pag_key)
+
+                progress.on_page_complete(
+                    ProgressEvent(
+                        query=query,
+                        page=page,
+                        total_pages=max_pages,
+                        results_count=len(organic),
+                        status="complete" if organic else "empty",
+                    )
                 )
-            )
 
-        # Early termination after consecutive empty pages
-        if consecutive_empty >= settings.consecutive_empty_limit:
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-            break
-
-    # Build organic results with deduplication metadata
-    organic_results = []
-    for url, data in organic_by_url.items():
+                if on_page is not None:
+                    await on_page(page, response)
+
+            # Early termination after consecutive empty pages
+            if consecutive_empty >= settings.consecutive_empty_limit:
+                break
+    finally:
+        # Only workers still mid-request remain; idle ones exit on the flag.
+        stop.set()
+        workers.cancel()
+
+    # Build organic results with deduplication metadata. Nested models are
+    # built with model_construct() since every field is produced here;
+    # SearchResult below stays validated as the single boundary check.
+    # Each entry is keyed by best_position so the sort below needs no
+    # attribute lookups.
+    ranked: list[tuple[int, OrganicResult]] = []
+    for data in organic_by_url.values():
         positions = data["positions"]
         pages = data["pages"]
+        best_position = min(positions)
 
-        organic_results.append(
-            OrganicResult(
+        ranked.append((
+            best_position,
+            OrganicResult.model_construct(
                 link=data["link"],
                 title=data["title"],
                 description=data["description"],
                 rank=data["rank"],
-                best_position=min(positions),
+                best_position=best_position,
                 avg_position=round(sum(positions) / len(positions), 2),
                 frequency=len(positions),
-                pages_seen=sorted(set(pages)),
-            )
-        )
+                pages_seen=pages if len(pages) < 2 else sorted(pages),
+            ),
+        ))
 
     # Sort by best_position
-    organic_results.sort(key=lambda x: x.best_position)
+    ranked.sort(key=itemgetter(0))
+    organic_results = [item for _, item in ranked]
 
     # Build general metadata
     general_data = (first_response or {}).get("general", {})
-    general = GeneralMetadata(
+    general = GeneralMetadata.model_construct(
         query=general_data.get("query", query),
         datetime=general_data.get("datetime"),
         language=general_data.get("language"),
@@ -358,18 +517,21 @@ async def fetch_all_pages(
         page_title=general_data.get("page_title"),
     )
 
-    # Build pagination
-    pagination = []
+    # Build pagination, parsing each page number once for the sort key
+    numbered: list[tuple[int, PaginationItem]] = []
     for pag in (first_response or {}).get("pagination", []):
         if isinstance(pag, dict):
-            pagination.append(
-                PaginationItem(
+            page_str = pag.get("page", "")
+            numbered.append((
+                int(page_str) if page_str.isdigit() else 0,
+                PaginationItem.model_construct(
                     link=pag.get("link", ""),
-                    page=pag.get("page", ""),
+                    page=page_str,
                     page_html=pag.get("page_html"),
-                )
-            )
-    pagination.sort(key=lambda x: int(x.page) if x.page.isdigit() else 0)
+                ),
+            ))
+    numbered.sort(key=itemgetter(0))
+    pagination = [item for _, item in numbered]
 
     result = SearchResult(
         url=first_response.get("url") if first_response else None,
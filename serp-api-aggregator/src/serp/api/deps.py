@@ -1,12 +1,15 @@
 """FastAPI dependency injection utilities."""
 
+import asyncio
 from typing import AsyncIterator
 
 from ..client import SerpAggregator
 from ..cache import ResultCache
 from ..settings import SerpSettings, get_settings
 
-# Global client instance (initialized on startup)
+# Global client instance (initialized on startup). It owns the HTTP session
+# opened by connect(), so the connection pool, DNS cache and TLS sessions
+# survive across requests.
 _client: SerpAggregator | None = None
 
 
@@ -40,8 +43,10 @@ async def init_client() -> None:
 
 
 async def close_client() -> None:
-    """Close the global client on shutdown."""
+    """Close the global client and its HTTP session on shutdown."""
     global _client
     if _client:
         await _client.close()
         _client = None
+        # Give SSL transports time to shut down cleanly
+        await asyncio.sleep(0.25)
@@ -1,7 +1,7 @@
 """FastAPI route handlers."""
 
 import asyncio
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
 try:
     from fastapi import APIRouter, Depends, HTTPException, Query
@@ -10,6 +10,8 @@ try:
 except ImportError:
     raise ImportError("FastAPI not installed. Run: pip install serp-aggregator[api]")
 
+import orjson
+
 from ..client import SerpAggregator
 from ..models import SearchResult, BatchResult, SearchParams, BatchSearchParams
 from ..exceptions import SerpError, SerpTimeoutError, SerpRateLimitError
@@ -34,8 +36,8 @@ class BatchSearchRequest(BaseModel):
     queries: list[str] = Field(..., min_length=1)
     max_pages: int = Field(default=25, ge=1, le=100)
     concurrency: int = Field(default=50, ge=1, le=200)
-    country: str = Field(default="us")
-    language: str = Field(default="en")
+    country: str = Field(default="us", pattern=r"^[a-z]{2}$")
+    language: str = Field(default="en", pattern=r"^[a-z]{2}(-[a-z]{2})?$")
     use_cache: bool = Field(default=True)
     parallel: bool = Field(default=False)
 
@@ -58,6 +60,7 @@ class StatsResponse(BaseModel):
     cache_misses: int
     cache_size: int
     rate_limit_rps: float
+    rate_limit_achieved_rps: float
 
 
 @router.get("/health", response_model=HealthResponse)
@@ -101,8 +104,8 @@ async def search_get(
     query: str = Query(..., min_length=1, max_length=500),
     max_pages: int = Query(default=25, ge=1, le=100),
     concurrency: int = Query(default=50, ge=1, le=200),
-    country: str = Query(default="us"),
-    language: str = Query(default="en"),
+    country: str = Query(default="us", pattern=r"^[a-z]{2}$"),
+    language: str = Query(default="en", pattern=r"^[a-z]{2}(-[a-z]{2})?$"),
     use_cache: bool = Query(default=True),
     client: SerpAggregator = Depends(get_client),
 ) -> SearchResult:
@@ -138,7 +141,8 @@ async def batch_search(
     """
     Execute batch search queries.
 
-    Set parallel=true to run queries in parallel.
+    Queries run a few at a time and the first failure fails the batch.
+    Set parallel=true to skip failed queries instead.
     """
     try:
         if request.parallel:
@@ -174,31 +178,55 @@ async def stream_search(
     query: str = Query(..., min_length=1, max_length=500),
     max_pages: int = Query(default=25, ge=1, le=100),
     concurrency: int = Query(default=50, ge=1, le=200),
-    country: str = Query(default="us"),
-    language: str = Query(default="en"),
+    country: str = Query(default="us", pattern=r"^[a-z]{2}$"),
+    language: str = Query(default="en", pattern=r"^[a-z]{2}(-[a-z]{2})?$"),
     client: SerpAggregator = Depends(get_client),
 ) -> StreamingResponse:
     """
     Stream search results via Server-Sent Events (SSE).
 
-    Results are streamed as NDJSON lines as each page completes.
+    Emits a "page" event with the raw organic results of each page as it
+    completes, then the aggregated SearchResult, then "done".
     """
     async def event_generator() -> AsyncIterator[str]:
-        try:
-            result = await client.search(
+        pages: asyncio.Queue[tuple[int, dict[str, Any]] | None] = asyncio.Queue()
+
+        async def on_page(page: int, response: dict[str, Any]) -> None:
+            await pages.put((page, response))
+
+        task = asyncio.create_task(
+            client.search(
                 query=query,
                 max_pages=max_pages,
                 concurrency=concurrency,
                 country=country,
                 language=language,
                 use_cache=False,  # Don't cache streaming results
+                on_page=on_page,
             )
+        )
+        task.add_done_callback(lambda _: pages.put_nowait(None))
+
+        try:
+            while (item := await pages.get()) is not None:
+                page, response = item
+                payload = {"page": page, "organic": response.get("organic", [])}
+                yield f"event: page\ndata: {orjson.dumps(payload).decode()}\n\n"
+
+            result = await task
             # Stream final result
             yield f"data: {result.model_dump_json()}\n\n"
             yield "event: done\ndata: {}\n\n"
 
         except SerpError as e:
-            yield f"event: error\ndata: {{\"error\": \"{str(e)}\"}}\n\n"
+            # orjson escapes quotes and newlines that would break SSE framing
+            error_data = orjson.dumps({"error": str(e)}).decode()
+            yield f"event: error\ndata: {error_data}\n\n"
+
+        finally:
+            # Client disconnected mid-stream
+            if not task.done():
+                task.cancel()
 
     return StreamingResponse(
         event_generator(),
@@ -223,6 +251,7 @@ async def get_stats(
         cache_misses=cache_stats.misses,
         cache_size=cache_stats.size,
         rate_limit_rps=rate_stats.current_rps,
+        rate_limit_achieved_rps=rate_stats.achieved_rps,
     )
 
 
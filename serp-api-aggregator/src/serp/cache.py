@@ -1,19 +1,23 @@
 """Result caching with in-memory and Redis backends."""
 
 import asyncio
+import contextlib
 import hashlib
-import json
+import heapq
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Protocol, runtime_checkable
+from functools import lru_cache
+from typing import Any, Literal, Protocol, runtime_checkable
 
 from .models import SearchResult
 
 
+@lru_cache(maxsize=4096)
 def generate_cache_key(query: str, country: str, language: str, max_pages: int) -> str:
     """Generate a deterministic cache key for search parameters."""
     key_data = f"{query}|{country}|{language}|{max_pages}"
-    return hashlib.sha256(key_data.encode()).hexdigest()[:32]
+    return hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()
 
 
 @dataclass
@@ -82,19 +86,19 @@ class NullCache:
         return self._stats
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with TTL support."""
 
     value: SearchResult
-    created_at: float
+    created_at: float  # time.monotonic() at insert
     ttl: int | None = None
 
-    @property
-    def is_expired(self) -> bool:
-        if self.ttl is None or self.ttl == 0:
+    def expired_at(self, now: float) -> bool:
+        """Whether the entry has expired at monotonic time `now`."""
+        if not self.ttl:
             return False
-        return time.time() - self.created_at > self.ttl
+        return now - self.created_at > self.ttl
 
 
 @dataclass
@@ -102,85 +106,84 @@ class InMemoryCache:
     """
     In-memory cache with TTL and LRU eviction.
 
-    Thread-safe for asyncio concurrent access.
+    Safe for concurrent tasks on a single event loop without a lock: no
+    operation awaits while touching the entries, so each one runs to
+    completion before another task can interleave. Not thread-safe.
     """
 
     default_ttl: int = 3600  # 1 hour
     max_size: int = 1000  # Maximum entries
 
-    _cache: dict[str, CacheEntry] = field(default_factory=dict)
-    _access_order: list[str] = field(default_factory=list)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Insertion order doubles as LRU order: oldest entries first
+    _cache: OrderedDict[str, CacheEntry] = field(default_factory=OrderedDict)
+    # (expires_at, key) min-heap so cleanup only visits expired entries.
+    # May hold stale items for keys since overwritten, deleted or evicted.
+    _expiry_heap: list[tuple[float, str]] = field(default_factory=list)
     _stats: CacheStats = field(default_factory=CacheStats)
+    _sweep_task: asyncio.Task[None] | None = None
 
     async def get(self, key: str) -> SearchResult | None:
         """Get result from cache."""
-        async with self._lock:
-            entry = self._cache.get(key)
+        entry = self._cache.get(key)
 
-            if entry is None:
-                self._stats.misses += 1
-                return None
+        if entry is None:
+            self._stats.misses += 1
+            return None
 
-            if entry.is_expired:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats.misses += 1
-                self._stats.evictions += 1
-                return None
+        if entry.expired_at(time.monotonic()):
+            del self._cache[key]
+            self._stats.misses += 1
+            self._stats.evictions += 1
+            return None
 
-            # Update access order (LRU)
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
+        # Update access order (LRU)
+        self._cache.move_to_end(key)
 
-            self._stats.hits += 1
-            return entry.value
+        self._stats.hits += 1
+        return entry.value
 
     async def set(self, key: str, value: SearchResult, ttl: int | None = None) -> None:
         """Store result in cache."""
-        async with self._lock:
-            # Evict if at capacity
-            while len(self._cache) >= self.max_size:
-                if self._access_order:
-                    oldest_key = self._access_order.pop(0)
-                    if oldest_key in self._cache:
-                        del self._cache[oldest_key]
-                        self._stats.evictions += 1
-                else:
-                    break
-
-            self._cache[key] = CacheEntry(
-                value=value,
-                created_at=time.time(),
-                ttl=ttl if ttl is not None else self.default_ttl,
-            )
-
-            if key in self._access_order:
-                self._access_order.remove(key)
-            self._access_order.append(key)
-
-            self._stats.sets += 1
-            self._stats.size = len(self._cache)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+        else:
+            # Evict if at capacity, recycling the evicted entry object
+            while self._cache and len(self._cache) >= self.max_size:
+                _, entry = self._cache.popitem(last=False)
+                self._stats.evictions += 1
+            if entry is None:
+                entry = CacheEntry(value=value, created_at=0.0)
+            self._cache[key] = entry
+
+        entry.value = value
+        entry.created_at = time.monotonic()
+        entry.ttl = ttl if ttl is not None else self.default_ttl
+        if entry.ttl:
+            heapq.heappush(self._expiry_heap, (entry.created_at + entry.ttl, key))
+            # Rebuild once stale items dominate so the heap stays O(size)
+            if len(self._expiry_heap) > 2 * len(self._cache) + 64:
+                self._expiry_heap = [
+                    (e.created_at + e.ttl, k) for k, e in self._cache.items() if e.ttl
+                ]
+                heapq.heapify(self._expiry_heap)
+
+        self._stats.sets += 1
+        self._stats.size = len(self._cache)
 
     async def delete(self, key: str) -> bool:
         """Delete result from cache."""
-        async with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
-                self._stats.size = len(self._cache)
-                return True
-            return False
+        if key in self._cache:
+            del self._cache[key]
+            self._stats.size = len(self._cache)
+            return True
+        return False
 
     async def clear(self) -> None:
         """Clear all cached results."""
-        async with self._lock:
-            self._cache.clear()
-            self._access_order.clear()
-            self._stats.size = 0
+        self._cache.clear()
+        self._expiry_heap.clear()
+        self._stats.size = 0
 
     @property
     def stats(self) -> CacheStats:
@@ -190,44 +193,132 @@ class InMemoryCache:
 
     async def cleanup_expired(self) -> int:
         """Remove expired entries. Returns count of removed entries."""
-        async with self._lock:
-            expired_keys = [k for k, v in self._cache.items() if v.is_expired]
-            for key in expired_keys:
+        now = time.monotonic()
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] < now:
+            _, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            # Skip stale items whose key was since refreshed or removed
+            if entry is not None and entry.expired_at(now):
                 del self._cache[key]
-                if key in self._access_order:
-                    self._access_order.remove(key)
                 self._stats.evictions += 1
+                removed += 1
+
+        self._stats.size = len(self._cache)
+        return removed
+
+    def start_sweeper(self, interval: float = 60) -> None:
+        """
+        Start a background task that removes expired entries periodically.
+
+        Expired entries are otherwise only dropped when they are read or
+        pushed out by LRU eviction. Must be called from a running event loop.
+        """
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop(interval))
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background sweeper if it is running."""
+        if self._sweep_task is not None:
+            self._sweep_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweep_task
+            self._sweep_task = None
+
+    async def _sweep_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.cleanup_expired()
 
-            self._stats.size = len(self._cache)
-            return len(expired_keys)
+
+# Leading bytes marking msgpack and zstd-compressed payloads; JSON payloads
+# always start with "{". A compressed payload wraps either of the others.
+_MSGPACK_MAGIC = b"\x01"
+_ZSTD_MAGIC = b"\x02"
 
 
 class RedisCache:
     """
     Redis-backed cache for distributed deployments.
 
+    Values are stored as plain JSON by default, or as msgpack (smaller and
+    faster to decode) with serializer="msgpack". Reads accept either
+    format, so switching serializer does not invalidate existing entries.
+    Compression is off by default; set compress_threshold to zstd-compress
+    values larger than that many bytes.
+
     Requires redis package: pip install redis
+    msgpack serializer requires: pip install msgpack
+    Compression requires: pip install zstandard
     """
 
+    # Writes do network I/O, so SerpAggregator runs them in the background
+    # instead of holding up the search that produced the result. Caches
+    # without this flag are written inline, keeping read-after-write.
+    background_writes = True
+
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379",
         default_ttl: int = 3600,
         key_prefix: str = "serp:",
+        serializer: Literal["json", "msgpack"] = "json",
+        pool_size: int = 100,
+        compress_threshold: int | None = None,
     ):
         self.redis_url = redis_url
         self.default_ttl = default_ttl
         self.key_prefix = key_prefix
+        self.serializer = serializer
+        self.pool_size = pool_size
+        self.compress_threshold = compress_threshold
         self._client: Any = None
         self._stats = CacheStats()
+        self._msgpack: Any = None
+        self._compressor: Any = None
+        self._decompressor: Any = None
+
+        if serializer == "msgpack":
+            self._msgpack = self._import_msgpack()
+        if compress_threshold is not None:
+            self._init_zstd()
+
+    @staticmethod
+    def _import_msgpack() -> Any:
+        try:
+            import msgpack  # type: ignore[import-untyped]
+
+            return msgpack
+        except ImportError:
+            raise ImportError(
+                "msgpack package required. Install with: pip install msgpack"
+            ) from None
 
-    async def _get_client(self):
+    def _init_zstd(self) -> None:
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(
+                "zstandard package required. Install with: pip install zstandard"
+            ) from None
+        self._compressor = zstandard.ZstdCompressor(level=3)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    async def _get_client(self) -> Any:
         """Lazy initialization of Redis client."""
         if self._client is None:
             try:
                 import redis.asyncio as redis
 
-                self._client = redis.from_url(self.redis_url)
+                # Keep raw bytes so values go straight to msgpack/pydantic
+                self._client = redis.from_url(
+                    self.redis_url,
+                    max_connections=self.pool_size,
+                    socket_keepalive=True,
+                    health_check_interval=30,
+                    decode_responses=False,
+                )
             except ImportError:
                 raise ImportError("Redis package required. Install with: pip install redis")
         return self._client
@@ -235,6 +326,30 @@ class RedisCache:
     def _make_key(self, key: str) -> str:
         return f"{self.key_prefix}{key}"
 
+    def _encode(self, value: SearchResult) -> bytes:
+        if self._msgpack is not None:
+            data: bytes = _MSGPACK_MAGIC + self._msgpack.packb(
+                value.model_dump(mode="json"), use_bin_type=True
+            )
+        else:
+            data = value.model_dump_json().encode()
+        if self.compress_threshold is not None and len(data) > self.compress_threshold:
+            compressed: bytes = self._compressor.compress(data)
+            return _ZSTD_MAGIC + compressed
+        return data
+
+    def _decode(self, data: bytes) -> SearchResult:
+        if data[:1] == _ZSTD_MAGIC:
+            if self._decompressor is None:
+                self._init_zstd()
+            data = self._decompressor.decompress(data[1:])
+        if data[:1] == _MSGPACK_MAGIC:
+            if self._msgpack is None:
+                self._msgpack = self._import_msgpack()
+            return SearchResult.model_validate(self._msgpack.unpackb(data[1:], raw=False))
+        # Parse and validate in one pass inside pydantic-core
+        return SearchResult.model_validate_json(data)
+
     async def get(self, key: str) -> SearchResult | None:
         """Get result from Redis."""
         try:
@@ -246,18 +361,40 @@ class RedisCache:
                 return None
 
             self._stats.hits += 1
-            result_dict = json.loads(data)
-            return SearchResult.model_validate(result_dict)
+            return self._decode(data)
 
         except Exception:
             self._stats.misses += 1
             return None
 
+    async def get_many(self, keys: list[str]) -> dict[str, SearchResult | None]:
+        """Get several results from Redis in a single MGET round trip."""
+        try:
+            client = await self._get_client()
+            values = await client.mget([self._make_key(key) for key in keys])
+        except Exception:
+            self._stats.misses += len(keys)
+            return dict.fromkeys(keys)
+
+        results: dict[str, SearchResult | None] = {}
+        for key, data in zip(keys, values, strict=True):
+            if data is None:
+                self._stats.misses += 1
+                results[key] = None
+                continue
+            try:
+                results[key] = self._decode(data)
+                self._stats.hits += 1
+            except Exception:
+                self._stats.misses += 1
+                results[key] = None
+        return results
+
     async def set(self, key: str, value: SearchResult, ttl: int | None = None) -> None:
         """Store result in Redis."""
         try:
             client = await self._get_client()
-            data = value.model_dump_json()
+            data = self._encode(value)
             ttl = ttl if ttl is not None else self.default_ttl
 
             if ttl > 0:
@@ -280,12 +417,22 @@ class RedisCache:
             return False
 
     async def clear(self) -> None:
-        """Clear all cached results with prefix."""
+        """
+        Clear all cached results with prefix.
+
+        Iterates with SCAN rather than KEYS so the server is never blocked,
+        and removes keys with UNLINK so memory is reclaimed in the background.
+        """
         try:
             client = await self._get_client()
-            keys = await client.keys(f"{self.key_prefix}*")
-            if keys:
-                await client.delete(*keys)
+            batch: list[bytes] = []
+            async for key in client.scan_iter(match=f"{self.key_prefix}*", count=1000):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await client.unlink(*batch)
+                    batch.clear()
+            if batch:
+                await client.unlink(*batch)
         except Exception:
             pass
 
@@ -297,5 +444,7 @@ class RedisCache:
     async def close(self) -> None:
         """Close Redis connection."""
         if self._client:
-            await self._client.close()
+            # redis>=5 renamed close() to aclose()
+            aclose = getattr(self._client, "aclose", None) or self._client.close
+            await aclose()
             self._client = None
@@ -1,18 +1,28 @@
 """Debug output utilities for CLI."""
 
 import csv
-import json
 import re
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from ..models import SearchResult
 
 DEBUG_DIR = Path("./debug")
 
+_SLUG_STRIP = re.compile(r'[^a-z0-9\s-]')
+_SLUG_SPACES = re.compile(r'[\s_]+')
+_SLUG_DASHES = re.compile(r'-+')
+
+_CSV_HEADER = (
+    'link', 'title', 'description', 'best_position',
+    'avg_position', 'frequency', 'pages_seen',
+)
+
 
 @dataclass
 class DebugConfig:
@@ -29,9 +39,9 @@ class DebugConfig:
 def slugify_query(query: str, max_length: int = 50) -> str:
     """Convert query to filesystem-safe slug."""
     slug = query.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_]+', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
+    slug = _SLUG_STRIP.sub('', slug)
+    slug = _SLUG_SPACES.sub('-', slug)
+    slug = _SLUG_DASHES.sub('-', slug)
     return slug[:max_length].rstrip('-')
 
 
@@ -46,13 +56,17 @@ def ensure_debug_dir() -> Path:
     return DEBUG_DIR
 
 
-def save_debug_json(result: "SearchResult", query: str) -> Path:
-    """Save full SearchResult as JSON."""
+def save_debug_json(result: "SearchResult", query: str, encoded: str | None = None) -> Path:
+    """Save full SearchResult as JSON, reusing `encoded` if already serialized."""
     ensure_debug_dir()
     slug = slugify_query(query)
     ts = generate_timestamp()
     path = DEBUG_DIR / f"{slug}_{ts}_json.json"
-    path.write_text(result.model_dump_json(indent=2))
+    if encoded is not None:
+        path.write_text(encoded)
+    else:
+        # Serialize straight to UTF-8 bytes, skipping the intermediate str
+        path.write_bytes(result.__pydantic_serializer__.to_json(result, indent=2))
     return path
 
 
@@ -63,22 +77,21 @@ def save_debug_csv(result: "SearchResult", query: str) -> Path:
     ts = generate_timestamp()
     path = DEBUG_DIR / f"{slug}_{ts}_csv.csv"
 
-    with path.open('w', newline='') as f:
-        writer = csv.DictWriter(f, fieldnames=[
-            'link', 'title', 'description', 'best_position',
-            'avg_position', 'frequency', 'pages_seen'
-        ])
-        writer.writeheader()
-        for item in result.organic:
-            writer.writerow({
-                'link': str(item.link),
-                'title': item.title,
-                'description': item.description or '',
-                'best_position': item.best_position,
-                'avg_position': item.avg_position,
-                'frequency': item.frequency,
-                'pages_seen': ','.join(map(str, item.pages_seen)),
-            })
+    with path.open('w', newline='', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(_CSV_HEADER)
+        writer.writerows(
+            (
+                str(item.link),
+                item.title,
+                item.description or '',
+                item.best_position,
+                item.avg_position,
+                item.frequency,
+                ','.join(map(str, item.pages_seen)),
+            )
+            for item in result.organic
+        )
     return path
 
 
@@ -89,7 +102,7 @@ def save_debug_raw(raw_responses: list[dict], query: str) -> Path:
     ts = generate_timestamp()
     path = DEBUG_DIR / f"{slug}_{ts}_raw.ndjson"
 
-    with path.open('w') as f:
-        for response in raw_responses:
-            f.write(json.dumps(response) + '\n')
+    with path.open('wb', buffering=1 << 20) as f:
+        if raw_responses:
+            f.write(b'\n'.join(map(orjson.dumps, raw_responses)) + b'\n')
     return path
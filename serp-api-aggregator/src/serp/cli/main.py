@@ -81,21 +81,8 @@ def search(
     try:
         result, raw_collector = asyncio.run(run())
 
-        # Save debug outputs
-        if debug_json:
-            debug_path = save_debug_json(result, query)
-            console.print(f"[dim]Debug JSON: {debug_path}[/dim]")
-        if debug_csv:
-            debug_path = save_debug_csv(result, query)
-            console.print(f"[dim]Debug CSV: {debug_path}[/dim]")
-        if debug_raw and raw_collector:
-            debug_path = save_debug_raw(raw_collector, query)
-            console.print(f"[dim]Debug raw: {debug_path}[/dim]")
-
         # Format output
-        if output_format == "json":
-            output = result.model_dump_json(indent=2)
-        elif output_format == "ndjson":
+        if output_format == "ndjson":
             output = result.model_dump_json()
         elif output_format == "csv":
             import csv
@@ -118,6 +105,19 @@ def search(
         else:
             output = result.model_dump_json(indent=2)
 
+        # Save debug outputs
+        if debug_json:
+            # Reuse the pretty JSON output rather than serializing twice
+            pretty_json = output if output_format not in ("ndjson", "csv") else None
+            debug_path = save_debug_json(result, query, encoded=pretty_json)
+            console.print(f"[dim]Debug JSON: {debug_path}[/dim]")
+        if debug_csv:
+            debug_path = save_debug_csv(result, query)
+            console.print(f"[dim]Debug CSV: {debug_path}[/dim]")
+        if debug_raw and raw_collector:
+            debug_path = save_debug_raw(raw_collector, query)
+            console.print(f"[dim]Debug raw: {debug_path}[/dim]")
+
         # Write output
         if output_file:
             output_file.write_text(output)
@@ -143,7 +143,7 @@ def batch(
     language: str = typer.Option("en", "--language", "-l"),
     output_format: str = typer.Option("json", "--format", "-o", help="Output format: json, ndjson"),
     output_file: Optional[Path] = typer.Option(None, "--output", help="Output file path"),
-    parallel: bool = typer.Option(False, "--parallel", help="Run queries in parallel"),
+    parallel: bool = typer.Option(False, "--parallel", help="Run queries in parallel, skipping failed ones"),
     no_cache: bool = typer.Option(False, "--no-cache"),
     quiet: bool = typer.Option(False, "--quiet", "-q"),
     verbose: bool = typer.Option(False, "--verbose", "-v"),
@@ -199,26 +199,34 @@ def batch(
                     use_cache=not no_cache,
                     raw_collector=raw_collector if debug_raw else None,
                 )
-            return result, raw_collector
 
-    try:
-        result, raw_collector = asyncio.run(run())
-
-        # Save debug outputs for each query
-        if debug_json or debug_csv:
-            for query, search_result in result.results.items():
-                if debug_json:
-                    debug_path = save_debug_json(search_result, query)
-                    console.print(f"[dim]Debug JSON ({query}): {debug_path}[/dim]")
-                if debug_csv:
-                    debug_path = save_debug_csv(search_result, query)
-                    console.print(f"[dim]Debug CSV ({query}): {debug_path}[/dim]")
+        # Save debug outputs in worker threads so the writes run concurrently
+        labels: list[str] = []
+        writes = []
+        for query, search_result in result.results.items():
+            if debug_json:
+                labels.append(f"Debug JSON ({query})")
+                writes.append(asyncio.to_thread(save_debug_json, search_result, query))
+            if debug_csv:
+                labels.append(f"Debug CSV ({query})")
+                writes.append(asyncio.to_thread(save_debug_csv, search_result, query))
         if debug_raw and raw_collector:
             # For batch, save all raw responses together
             # Use first query as filename base
             first_query = query_list[0] if query_list else "batch"
-            debug_path = save_debug_raw(raw_collector, first_query)
-            console.print(f"[dim]Debug raw (all queries): {debug_path}[/dim]")
+            labels.append("Debug raw (all queries)")
+            writes.append(asyncio.to_thread(save_debug_raw, raw_collector, first_query))
+        debug_paths = await asyncio.gather(*writes)
+        return result, list(zip(labels, debug_paths, strict=True))
+
+    try:
+        result, debug_outputs = asyncio.run(run())
+
+        if debug_outputs:
+            # One render pass for all debug paths instead of one per file
+            console.print("\n".join(
+                f"[dim]{label}: {debug_path}[/dim]" for label, debug_path in debug_outputs
+            ))
 
         # Format output
         if output_format == "json":
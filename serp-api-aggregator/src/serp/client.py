@@ -2,9 +2,8 @@
 
 import asyncio
 import time
-from typing import AsyncIterator
-
-import aiohttp
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import TYPE_CHECKING, Any
 
 from .cache import InMemoryCache, NullCache, ResultCache, generate_cache_key
 from .exceptions import SerpConfigError
@@ -12,7 +11,21 @@ from .models import BatchResult, QueryTiming, SearchResult
 from .progress import NullProgress, ProgressReporter
 from .rate_limiter import AdaptiveRateLimiter, NullRateLimiter, RateLimiter
 from .settings import SerpSettings, get_settings
-from ._internal.bright_data import fetch_all_pages
+
+# aiohttp and the request module are imported on first use so that importing
+# the package (e.g. for the CLI's --help) does not load the HTTP stack.
+if TYPE_CHECKING:
+    import aiohttp
+
+
+# Override tuples come from request parameters, so the memo of settings
+# copies is capped; the oldest entry is dropped when it is full
+_SETTINGS_CACHE_SIZE = 64
+
+
+def _normalize_queries(queries: list[str]) -> list[str]:
+    """Strip queries once and drop the empty ones."""
+    return [q for q in map(str.strip, queries) if q]
 
 
 class SerpAggregator:
@@ -46,6 +59,9 @@ class SerpAggregator:
         progress: ProgressReporter | None = None,
         cache: ResultCache | None = None,
         rate_limiter: RateLimiter | None = None,
+        session: "aiohttp.ClientSession | None" = None,
+        connector_limit: int | None = None,
+        connector_limit_per_host: int | None = None,
     ):
         """
         Initialize SERP Aggregator.
@@ -55,15 +71,22 @@ class SerpAggregator:
             progress: Progress reporter for status updates.
             cache: Result cache. Uses InMemoryCache if caching enabled in settings.
             rate_limiter: Rate limiter. Uses AdaptiveRateLimiter if enabled in settings.
+            session: Shared HTTP session. The caller keeps ownership and must
+                close it; close() leaves it open.
+            connector_limit: Total connection pool size for the session opened
+                by connect(). Defaults to settings.global_max_inflight.
+            connector_limit_per_host: Per-host pool size for that session.
+                Defaults to settings.global_max_inflight.
         """
         self._settings = settings or get_settings()
         self._progress = progress or NullProgress()
 
         # Initialize cache
+        self._owned_memory_cache: InMemoryCache | None = None
         if cache is not None:
             self._cache = cache
         elif self._settings.cache_enabled:
-            self._cache = InMemoryCache(
+            self._cache = self._owned_memory_cache = InMemoryCache(
                 default_ttl=self._settings.cache_ttl,
             )
         else:
@@ -80,21 +103,65 @@ class SerpAggregator:
         else:
             self._rate_limiter = NullRateLimiter()
 
-        self._session: aiohttp.ClientSession | None = None
-        self._owns_session = False
+        self._session: aiohttp.ClientSession | None = session
+        # Set only when connect() built the session, i.e. when we own it
+        self._connector: aiohttp.TCPConnector | None = None
+        self._connector_limit = connector_limit or self._settings.global_max_inflight
+        self._connector_limit_per_host = (
+            connector_limit_per_host or self._settings.global_max_inflight
+        )
+
+        # Caps in-flight requests across all queries run by this client;
+        # per-query concurrency only bounds a single query's worker pool.
+        self._request_semaphore = asyncio.Semaphore(self._settings.global_max_inflight)
+
+        # Built on first fetch; immutable, so one instance serves every
+        # submit and poll request
+        self._timeout: aiohttp.ClientTimeout | None = None
+        # Per-request settings copies keyed by (country, language,
+        # max_pages, concurrency), at most _SETTINGS_CACHE_SIZE of them
+        self._settings_cache: dict[tuple[str, str, int, int], SerpSettings] = {}
+        # Cache writes run in the background; strong references keep the
+        # tasks alive until they finish, and close() waits for the rest
+        self._pending_writes: set[asyncio.Task[None]] = set()
 
     async def connect(self) -> None:
         """Open HTTP session."""
         if self._session is None:
-            self._session = aiohttp.ClientSession()
-            self._owns_session = True
+            import aiohttp
+
+            # Every request goes to the same API host, so size the pool to
+            # the in-flight cap and keep connections and DNS warm between pages.
+            self._connector = aiohttp.TCPConnector(
+                limit=self._connector_limit,
+                limit_per_host=self._connector_limit_per_host,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
+            self._session = aiohttp.ClientSession(connector=self._connector)
+        if self._owned_memory_cache is not None:
+            self._owned_memory_cache.start_sweeper()
 
     async def close(self) -> None:
         """Close HTTP session and cleanup resources."""
-        if self._session and self._owns_session:
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
+        if self._owned_memory_cache is not None:
+            await self._owned_memory_cache.stop_sweeper()
+        if self._session and self._connector is not None:
             await self._session.close()
             self._session = None
-            self._owns_session = False
+            self._connector = None
+
+    def _ensure_session(self) -> "aiohttp.ClientSession":
+        """Ensure session is connected."""
+        if self._session is None:
+            raise SerpConfigError(
+                "Client not connected. Use 'async with SerpAggregator()' "
+                "or call connect() first."
+            )
+        return self._session
 
     async def __aenter__(self) -> "SerpAggregator":
         """Async context manager entry."""
@@ -105,15 +172,6 @@ class SerpAggregator:
         """Async context manager exit."""
         await self.close()
 
-    def _ensure_session(self) -> aiohttp.ClientSession:
-        """Ensure session is connected."""
-        if self._session is None:
-            raise SerpConfigError(
-                "Client not connected. Use 'async with SerpAggregator()' "
-                "or call connect() first."
-            )
-        return self._session
-
     async def search(
         self,
         query: str,
@@ -124,6 +182,7 @@ class SerpAggregator:
         language: str | None = None,
         use_cache: bool = True,
         raw_collector: list[dict] | None = None,
+        on_page: Callable[[int, dict[str, Any]], Awaitable[None]] | None = None,
     ) -> SearchResult:
         """
         Execute a single search query.
@@ -135,6 +194,8 @@ class SerpAggregator:
             country: Country code (default from settings)
             language: Language code (default from settings)
             use_cache: Whether to use cache (default True)
+            on_page: Coroutine called with (page, raw response) as each page
+                completes. Not called on cache hits.
 
         Returns:
             SearchResult with deduplicated organic results
@@ -145,7 +206,7 @@ class SerpAggregator:
             SerpTimeoutError: On timeout
             SerpValidationError: On invalid input
         """
-        session = self._ensure_session()
+        self._ensure_session()
 
         # Apply defaults
         max_pages = max_pages or self._settings.default_max_pages
@@ -154,6 +215,7 @@ class SerpAggregator:
         language = language or self._settings.default_language
 
         # Check cache
+        cache_key = None
         if use_cache:
             cache_key = generate_cache_key(query, country, language, max_pages)
             cached_result = await self._cache.get(cache_key)
@@ -161,25 +223,60 @@ class SerpAggregator:
                 self._progress.on_cache_hit(query)
                 return cached_result
 
-        # Create settings override for this request
-        request_settings = SerpSettings(
-            bright_data_api_key=self._settings.bright_data_api_key,
-            bright_data_zone=self._settings.bright_data_zone,
-            api_base_url=self._settings.api_base_url,
-            default_country=country,
-            default_language=language,
-            default_max_pages=max_pages,
-            default_concurrency=concurrency,
-            poll_interval=self._settings.poll_interval,
-            max_polls=self._settings.max_polls,
-            request_timeout=self._settings.request_timeout,
-            max_retries=self._settings.max_retries,
-            retry_backoff=self._settings.retry_backoff,
-            rate_limit_enabled=self._settings.rate_limit_enabled,
-            rate_limit_rps=self._settings.rate_limit_rps,
-            consecutive_empty_limit=self._settings.consecutive_empty_limit,
+        return await self._fetch(
+            query,
+            max_pages=max_pages,
+            concurrency=concurrency,
+            country=country,
+            language=language,
+            cache_key=cache_key,
+            raw_collector=raw_collector,
+            on_page=on_page,
         )
 
+    async def _fetch(
+        self,
+        query: str,
+        *,
+        max_pages: int,
+        concurrency: int,
+        country: str,
+        language: str,
+        cache_key: str | None,
+        raw_collector: list[dict[str, Any]] | None = None,
+        on_page: Callable[[int, dict[str, Any]], Awaitable[None]] | None = None,
+    ) -> SearchResult:
+        """
+        Fetch a query from the API, bypassing the cache lookup.
+
+        The result is stored under `cache_key` unless it is None.
+        """
+        from ._internal.bright_data import build_timeout, fetch_all_pages
+
+        session = self._ensure_session()
+        if self._timeout is None:
+            self._timeout = build_timeout(self._settings)
+
+        # Override per-request fields on validated settings, so bounds and
+        # country/language patterns still apply; unlike constructing a new
+        # SerpSettings this skips the environment reload. Batches mostly
+        # repeat the same overrides, so each tuple is validated only once.
+        overrides = (country, language, max_pages, concurrency)
+        request_settings = self._settings_cache.get(overrides)
+        if request_settings is None:
+            request_settings = SerpSettings.model_validate(
+                {
+                    **self._settings.model_dump(),
+                    "default_country": country,
+                    "default_language": language,
+                    "default_max_pages": max_pages,
+                    "default_concurrency": concurrency,
+                }
+            )
+            if len(self._settings_cache) >= _SETTINGS_CACHE_SIZE:
+                del self._settings_cache[next(iter(self._settings_cache))]
+            self._settings_cache[overrides] = request_settings
+
         # Fetch results
         result = await fetch_all_pages(
             session=session,
@@ -190,15 +287,30 @@ class SerpAggregator:
             progress=self._progress,
             rate_limiter=self._rate_limiter,
             raw_collector=raw_collector,
+            on_page=on_page,
+            timeout=self._timeout,
+            request_semaphore=self._request_semaphore,
         )
 
-        # Cache result
-        if use_cache and not result.has_errors:
-            cache_key = generate_cache_key(query, country, language, max_pages)
-            await self._cache.set(cache_key, result)
+        # Cache result. Writes must be visible to the next lookup, so only
+        # caches that opt in with background_writes (e.g. RedisCache) are
+        # written in the background without holding up the caller.
+        if cache_key is not None and not result.has_errors:
+            if getattr(self._cache, "background_writes", False):
+                task = asyncio.create_task(self._cache.set(cache_key, result))
+                self._pending_writes.add(task)
+                task.add_done_callback(self._on_write_done)
+            else:
+                await self._cache.set(cache_key, result)
 
         return result
 
+    def _on_write_done(self, task: asyncio.Task[None]) -> None:
+        """Forget a finished cache write; cache errors never fail a search."""
+        self._pending_writes.discard(task)
+        if not task.cancelled():
+            task.exception()
+
     async def search_batch(
         self,
         queries: list[str],
@@ -208,12 +320,15 @@ class SerpAggregator:
         country: str | None = None,
         language: str | None = None,
         use_cache: bool = True,
+        max_parallel_queries: int = 5,
         raw_collector: list[dict] | None = None,
     ) -> BatchResult:
         """
-        Execute multiple search queries sequentially.
+        Execute multiple search queries, a bounded number at a time.
 
-        For truly parallel execution, use search_parallel().
+        Unlike search_parallel(), the first failing query aborts the batch
+        and its error is raised. Pass max_parallel_queries=1 to run the
+        queries strictly one after another.
 
         Args:
             queries: List of search queries
@@ -222,54 +337,93 @@ class SerpAggregator:
             country: Country code
             language: Language code
             use_cache: Whether to use cache
+            max_parallel_queries: Maximum queries to run in parallel
 
         Returns:
-            BatchResult with all query results
+            BatchResult with all query results, in input order
         """
-        start_time = time.time()
+        self._ensure_session()
+        start_time = time.perf_counter()
 
-        results: dict[str, SearchResult] = {}
-        timing: dict[str, float] = {}
-        query_timings: list[QueryTiming] = []
-        total_organic = 0
+        max_pages = max_pages or self._settings.default_max_pages
+        concurrency = concurrency or self._settings.default_concurrency
+        country = country or self._settings.default_country
+        language = language or self._settings.default_language
 
-        for query in queries:
-            query = query.strip()
-            if not query:
-                continue
+        # Duplicates would only race each other for the same results entry
+        query_list = list(dict.fromkeys(_normalize_queries(queries)))
 
-            query_start = time.time()
-            result = await self.search(
-                query,
-                max_pages=max_pages,
-                concurrency=concurrency,
-                country=country,
-                language=language,
-                use_cache=use_cache,
-                raw_collector=raw_collector,
-            )
+        # Caches that support bulk reads (e.g. Redis MGET) are queried for
+        # the whole batch up front; misses then go straight to the API.
+        cached: dict[str, SearchResult | None] | None = None
+        cache_keys: dict[str, str] = {}
+        get_many = getattr(self._cache, "get_many", None)
+        if use_cache and get_many is not None:
+            cache_keys = {
+                q: generate_cache_key(q, country, language, max_pages) for q in query_list
+            }
+            cached = await get_many(list(cache_keys.values()))
 
-            elapsed = time.time() - query_start
-            results[query] = result
-            timing[query] = round(elapsed, 2)
-            total_organic += len(result.organic)
+        query_semaphore = asyncio.Semaphore(max_parallel_queries)
 
-            query_timings.append(
-                QueryTiming(
-                    query=query,
-                    elapsed_seconds=round(elapsed, 2),
-                    result_count=len(result.organic),
-                    pages_fetched=result.pages_fetched,
-                    errors=len(result.errors),
-                )
+        async def search_with_timing(query: str) -> tuple[SearchResult, float]:
+            async with query_semaphore:
+                query_start = time.perf_counter()
+                if cached is not None:
+                    cache_key = cache_keys[query]
+                    result = cached.get(cache_key)
+                    if result is not None:
+                        self._progress.on_cache_hit(query)
+                    else:
+                        result = await self._fetch(
+                            query,
+                            max_pages=max_pages,
+                            concurrency=concurrency,
+                            country=country,
+                            language=language,
+                            cache_key=cache_key,
+                            raw_collector=raw_collector,
+                        )
+                else:
+                    result = await self.search(
+                        query,
+                        max_pages=max_pages,
+                        concurrency=concurrency,
+                        country=country,
+                        language=language,
+                        use_cache=use_cache,
+                        raw_collector=raw_collector,
+                    )
+                return result, time.perf_counter() - query_start
+
+        tasks = [asyncio.ensure_future(search_with_timing(q)) for q in query_list]
+        try:
+            completed = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+        # Column lists in input order; the mappings are built once from them
+        batch_results = [result for result, _ in completed]
+        elapsed = [round(seconds, 2) for _, seconds in completed]
+        query_timings = [
+            QueryTiming(
+                query=query,
+                elapsed_seconds=seconds,
+                result_count=len(result.organic),
+                pages_fetched=result.pages_fetched,
+                errors=len(result.errors),
             )
-
-        return BatchResult(
-            queries=queries,
-            results=results,
-            timing=timing,
-            total_organic=total_organic,
-            total_elapsed_seconds=round(time.time() - start_time, 2),
+            for query, result, seconds in zip(query_list, batch_results, elapsed, strict=True)
+        ]
+        # Every field was built above from validated models; skip revalidation
+        return BatchResult.model_construct(
+            queries=query_list,
+            results=dict(zip(query_list, batch_results, strict=True)),
+            timing=dict(zip(query_list, elapsed, strict=True)),
+            total_organic=sum(len(result.organic) for result in batch_results),
+            total_elapsed_seconds=round(time.perf_counter() - start_time, 2),
             query_timings=query_timings,
         )
 
@@ -288,6 +442,9 @@ class SerpAggregator:
         """
         Execute multiple search queries in parallel.
 
+        Failed queries are left out of results and reported in
+        query_timings with errors=1.
+
         Args:
             queries: List of search queries
             max_pages: Maximum pages per query
@@ -300,14 +457,17 @@ class SerpAggregator:
         Returns:
             BatchResult with all query results
         """
-        start_time = time.time()
+        self._ensure_session()
+        start_time = time.perf_counter()
 
         # Create semaphore for parallel query limit
         query_semaphore = asyncio.Semaphore(max_parallel_queries)
 
-        async def search_with_timing(query: str) -> tuple[str, SearchResult, float]:
+        query_list = _normalize_queries(queries)
+
+        async def search_with_timing(query: str) -> tuple[SearchResult, float]:
             async with query_semaphore:
-                query_start = time.time()
+                query_start = time.perf_counter()
                 result = await self.search(
                     query,
                     max_pages=max_pages,
@@ -317,43 +477,56 @@ class SerpAggregator:
                     use_cache=use_cache,
                     raw_collector=raw_collector,
                 )
-                elapsed = time.time() - query_start
-                return query, result, elapsed
+                elapsed = time.perf_counter() - query_start
+                return result, elapsed
 
-        # Run all queries in parallel
-        tasks = [search_with_timing(q.strip()) for q in queries if q.strip()]
+        # Run all queries in parallel; gather keeps input order
+        tasks = [search_with_timing(q) for q in query_list]
         completed = await asyncio.gather(*tasks, return_exceptions=True)
 
-        results: dict[str, SearchResult] = {}
-        timing: dict[str, float] = {}
+        # Column lists for the successful queries; mappings are built once
+        ok_queries: list[str] = []
+        ok_results: list[SearchResult] = []
+        ok_elapsed: list[float] = []
         query_timings: list[QueryTiming] = []
-        total_organic = 0
 
-        for item in completed:
-            if isinstance(item, Exception):
-                continue  # Skip failed queries
+        for query, item in zip(query_list, completed, strict=True):
+            if isinstance(item, BaseException):
+                # Failed or cancelled queries get no result, only a timing entry
+                query_timings.append(
+                    QueryTiming(
+                        query=query,
+                        elapsed_seconds=0.0,
+                        result_count=0,
+                        pages_fetched=0,
+                        errors=1,
+                    )
+                )
+                continue
 
-            query, result, elapsed = item
-            results[query] = result
-            timing[query] = round(elapsed, 2)
-            total_organic += len(result.organic)
+            result, elapsed = item
+            elapsed = round(elapsed, 2)
+            ok_queries.append(query)
+            ok_results.append(result)
+            ok_elapsed.append(elapsed)
 
             query_timings.append(
                 QueryTiming(
                     query=query,
-                    elapsed_seconds=round(elapsed, 2),
+                    elapsed_seconds=elapsed,
                     result_count=len(result.organic),
                     pages_fetched=result.pages_fetched,
                     errors=len(result.errors),
                 )
             )
 
-        return BatchResult(
-            queries=queries,
-            results=results,
-            timing=timing,
-            total_organic=total_organic,
-            total_elapsed_seconds=round(time.time() - start_time, 2),
+        # Every field was built above from validated models; skip revalidation
+        return BatchResult.model_construct(
+            queries=query_list,
+            results=dict(zip(ok_queries, ok_results, strict=True)),
+            timing=dict(zip(ok_queries, ok_elapsed, strict=True)),
+            total_organic=sum(len(result.organic) for result in ok_results),
+            total_elapsed_seconds=round(time.perf_counter() - start_time, 2),
             query_timings=query_timings,
         )
 
@@ -366,27 +539,41 @@ class SerpAggregator:
         country: str | None = None,
         language: str | None = None,
         use_cache: bool = True,
+        max_parallel_queries: int = 5,
     ) -> AsyncIterator[tuple[str, SearchResult]]:
         """
         Stream search results as each query completes.
 
+        Up to max_parallel_queries run at once, so results arrive in
+        completion order rather than input order. An error from any query
+        is raised and cancels the ones still running.
+
         Yields:
             Tuple of (query, SearchResult) as each query completes
         """
-        for query in queries:
-            query = query.strip()
-            if not query:
-                continue
+        self._ensure_session()
+        query_semaphore = asyncio.Semaphore(max_parallel_queries)
 
-            result = await self.search(
-                query,
-                max_pages=max_pages,
-                concurrency=concurrency,
-                country=country,
-                language=language,
-                use_cache=use_cache,
-            )
-            yield query, result
+        async def search_one(query: str) -> tuple[str, SearchResult]:
+            async with query_semaphore:
+                result = await self.search(
+                    query,
+                    max_pages=max_pages,
+                    concurrency=concurrency,
+                    country=country,
+                    language=language,
+                    use_cache=use_cache,
+                )
+                return query, result
+
+        tasks = [asyncio.create_task(search_one(q)) for q in _normalize_queries(queries)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     @property
     def cache(self) -> ResultCache:
@@ -398,12 +585,63 @@ class SerpAggregator:
         """Get the rate limiter instance."""
         return self._rate_limiter
 
+    @property
+    def request_semaphore(self) -> asyncio.Semaphore:
+        """Get the semaphore capping in-flight requests across queries."""
+        return self._request_semaphore
+
     @property
     def settings(self) -> SerpSettings:
         """Get the settings instance."""
         return self._settings
 
 
+# Shared client behind the convenience functions, opened explicitly with
+# open_default_client() and closed with aclose_default_client(). It is bound
+# to the event loop that opened it; without one, each call falls back to a
+# temporary client that is closed before the call returns.
+_default_client: SerpAggregator | None = None
+_default_loop: asyncio.AbstractEventLoop | None = None
+
+
+async def open_default_client(settings: SerpSettings | None = None) -> SerpAggregator:
+    """
+    Open a shared client for search() and search_batch() on this event loop.
+
+    Repeated convenience calls then reuse one connection pool instead of
+    opening a session per call. Close it with aclose_default_client()
+    before the loop shuts down.
+
+    Usage:
+        await serp.open_default_client()
+        try:
+            result = await serp.search("python tutorial")
+        finally:
+            await serp.aclose_default_client()
+    """
+    global _default_client, _default_loop
+    await aclose_default_client()
+    client = SerpAggregator(settings=settings)
+    await client.connect()
+    _default_client, _default_loop = client, asyncio.get_running_loop()
+    return client
+
+
+async def aclose_default_client() -> None:
+    """Close the shared client opened by open_default_client(), if any."""
+    global _default_client, _default_loop
+    client, _default_client, _default_loop = _default_client, None, None
+    if client is not None:
+        await client.close()
+
+
+def _get_default_client() -> SerpAggregator | None:
+    """Get the shared client if one is open on the running loop."""
+    if _default_client is not None and _default_loop is asyncio.get_running_loop():
+        return _default_client
+    return None
+
+
 # Convenience function for one-off searches
 async def search(
     query: str,
@@ -414,7 +652,8 @@ async def search(
     """
     Convenience function for single search.
 
-    Creates a temporary client and executes one search.
+    Uses the shared client from open_default_client() when one is open and
+    no settings are given; otherwise creates a temporary client.
 
     Usage:
         result = await serp.search("python tutorial")
@@ -427,6 +666,8 @@ async def search(
     Returns:
         SearchResult with deduplicated organic results
     """
+    if settings is None and (client := _get_default_client()) is not None:
+        return await client.search(query, **kwargs)
     async with SerpAggregator(settings=settings) as client:
         return await client.search(query, **kwargs)
 
@@ -440,7 +681,8 @@ async def search_batch(
     """
     Convenience function for batch search.
 
-    Creates a temporary client and executes batch search.
+    Uses the shared client from open_default_client() when one is open and
+    no settings are given; otherwise creates a temporary client.
 
     Usage:
         result = await serp.search_batch(["query1", "query2"])
@@ -453,5 +695,7 @@ async def search_batch(
     Returns:
         BatchResult with all query results
     """
+    if settings is None and (client := _get_default_client()) is not None:
+        return await client.search_batch(queries, **kwargs)
     async with SerpAggregator(settings=settings) as client:
         return await client.search_batch(queries, **kwargs)
@@ -28,7 +28,12 @@ class SerpValidationError(SerpError):
 
 
 class SerpAPIError(SerpError):
-    """API communication error."""
+    """
+    API communication error.
+
+    Terminal errors (e.g. rejected credentials) will fail identically on
+    every request, so callers should stop instead of retrying.
+    """
 
     def __init__(
         self,
@@ -36,10 +41,12 @@ class SerpAPIError(SerpError):
         status_code: int | None = None,
         response_id: str | None = None,
         details: dict[str, Any] | None = None,
+        is_terminal: bool = False,
     ):
         super().__init__(message, details)
         self.status_code = status_code
         self.response_id = response_id
+        self.is_terminal = is_terminal
 
 
 class SerpTimeoutError(SerpAPIError):
@@ -151,5 +151,6 @@ class BatchResult(BaseModel):
 
     @property
     def error_count(self) -> int:
-        """Number of queries with errors."""
-        return sum(1 for r in self.results.values() if r.has_errors)
+        """Number of queries with errors, including failed ones with no result."""
+        failed = sum(1 for q in set(self.queries) if q not in self.results)
+        return failed + sum(1 for r in self.results.values() if r.has_errors)
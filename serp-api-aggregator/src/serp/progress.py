@@ -1,12 +1,28 @@
 """Progress reporting protocol and implementations."""
 
 import sys
-from dataclasses import dataclass, field
+import time
+from collections import deque
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
-from typing import Callable, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 
 
-@dataclass
+class _EventTimestamp:
+    """
+    `ProgressEvent.timestamp`: a datetime built from `created_at` on read.
+
+    On the class it yields None, the default for the init-only `timestamp`
+    argument that callers may still pass to set the creation time.
+    """
+
+    def __get__(self, obj: Any, objtype: type | None = None) -> Any:
+        if obj is None:
+            return None
+        return datetime.fromtimestamp(obj.created_at)
+
+
+@dataclass(slots=True)
 class ProgressEvent:
     """Progress event data."""
 
@@ -16,7 +32,14 @@ class ProgressEvent:
     results_count: int
     status: str  # "fetching", "complete", "error", "cached"
     message: str | None = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    # Local time the event was created; overrides created_at when given
+    timestamp: InitVar[datetime | None] = _EventTimestamp()
+    # Epoch seconds; converted to a datetime only when `timestamp` is read
+    created_at: float = field(default_factory=time.time)
+
+    def __post_init__(self, timestamp: datetime | None) -> None:
+        if timestamp is not None:
+            self.created_at = timestamp.timestamp()
 
     @property
     def progress_pct(self) -> float:
@@ -136,32 +159,41 @@ class CallbackProgress:
 
 
 class AggregatingProgress:
-    """Progress reporter that aggregates events for batch operations."""
+    """
+    Progress reporter that aggregates events for batch operations.
+
+    Only the most recent `max_events` page events and `max_errors` errors
+    are kept; the page and error counters cover the reporter's lifetime.
+    """
 
-    def __init__(self):
-        self.events: list[ProgressEvent] = []
+    def __init__(self, max_events: int = 10_000, max_errors: int = 1000):
+        self.events: deque[ProgressEvent] = deque(maxlen=max_events)
         self.query_starts: dict[str, datetime] = {}
         self.query_results: dict[str, int] = {}
-        self.errors: list[tuple[str, str, int | None]] = []
+        self.errors: deque[tuple[str, str, int | None]] = deque(maxlen=max_errors)
+        self._total_pages = 0
+        self._error_count = 0
 
     def on_query_start(self, query: str, total_pages: int) -> None:
         self.query_starts[query] = datetime.now()
 
     def on_page_complete(self, event: ProgressEvent) -> None:
         self.events.append(event)
+        self._total_pages += 1
 
     def on_query_complete(self, query: str, total_results: int, elapsed_seconds: float) -> None:
         self.query_results[query] = total_results
 
     def on_error(self, query: str, error: str, page: int | None = None) -> None:
         self.errors.append((query, error, page))
+        self._error_count += 1
 
     def on_cache_hit(self, query: str) -> None:
         pass
 
     @property
     def total_pages_fetched(self) -> int:
-        return len(self.events)
+        return self._total_pages
 
     @property
     def total_results(self) -> int:
@@ -169,4 +201,4 @@ class AggregatingProgress:
 
     @property
     def error_count(self) -> int:
-        return len(self.errors)
+        return self._error_count
@@ -1,7 +1,9 @@
 """Adaptive rate limiter with circuit breaker pattern."""
 
 import asyncio
+import random
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Protocol, runtime_checkable
@@ -26,6 +28,7 @@ class RateLimiterStats:
     errors_total: int = 0
     circuit_opens: int = 0
     current_rps: float = 0.0
+    achieved_rps: float = 0.0  # Requests let through per second, last 10s
     circuit_state: CircuitState = CircuitState.CLOSED
 
 
@@ -74,12 +77,15 @@ class NullRateLimiter:
     async def on_error(self) -> None:
         self._stats.errors_total += 1
 
+    async def on_cancel(self) -> None:
+        pass
+
     @property
     def stats(self) -> RateLimiterStats:
         return self._stats
 
 
-@dataclass
+@dataclass(slots=True)
 class AdaptiveRateLimiter:
     """
     Adaptive rate limiter with circuit breaker.
@@ -89,6 +95,10 @@ class AdaptiveRateLimiter:
     - Automatic rate reduction on 429 responses
     - Gradual rate increase on success
     - Circuit breaker for failure protection
+
+    Needs no lock on a single event loop: state is only read and updated
+    between awaits, so each update runs to completion before another task
+    can interleave. Not thread-safe.
     """
 
     # Configuration
@@ -99,29 +109,37 @@ class AdaptiveRateLimiter:
 
     # Circuit breaker settings
     error_threshold: int = 5  # Errors before opening circuit
-    recovery_timeout: float = 30.0  # Seconds before trying half-open
-    success_threshold: int = 3  # Successes in half-open before closing
+    recovery_timeout: float = 30.0  # Seconds before trying half-open (±20% jitter)
+    success_threshold: int = 3  # Successes in half-open before closing; also the probe cap
 
     # Internal state
     _current_rps: float = field(init=False)
     _tokens: float = field(init=False)
     _last_update: float = field(init=False)
-    _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
 
     # Circuit breaker state
     _circuit_state: CircuitState = field(init=False, default=CircuitState.CLOSED)
     _consecutive_errors: int = field(init=False, default=0)
     _consecutive_successes: int = field(init=False, default=0)
-    _circuit_opened_at: float = field(init=False, default=0.0)
+    # OPEN: when to start probing. HALF_OPEN: when unanswered probes are
+    # presumed lost and a new set may go out.
+    _recovery_deadline: float = field(init=False, default=0.0)
+    _probes_in_flight: int = field(init=False, default=0)
 
     # Stats
     _stats: RateLimiterStats = field(init=False, default_factory=RateLimiterStats)
+    # Allowed requests per one-second bucket over the last ten seconds;
+    # the last bucket is the one currently filling
+    _rps_buckets: deque[int] = field(
+        init=False, default_factory=lambda: deque([0] * 10, maxlen=10)
+    )
+    _bucket_start: float = field(init=False, default=0.0)
 
     def __post_init__(self):
         self._current_rps = self.initial_rps
         self._tokens = float(self.burst_size)
         self._last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._bucket_start = self._last_update
         self._stats.current_rps = self._current_rps
 
     async def acquire(self) -> None:
@@ -129,96 +147,141 @@ class AdaptiveRateLimiter:
         Wait until a request is allowed.
 
         Raises:
-            RuntimeError: If circuit is open
+            RuntimeError: If circuit is open, or half-open with all probes
+                still in flight
         """
-        async with self._lock:
-            self._stats.requests_total += 1
-
-            # Check circuit breaker
-            if self._circuit_state == CircuitState.OPEN:
-                if time.monotonic() - self._circuit_opened_at > self.recovery_timeout:
-                    self._circuit_state = CircuitState.HALF_OPEN
-                    self._consecutive_successes = 0
-                else:
-                    self._stats.requests_throttled += 1
-                    raise RuntimeError("Circuit breaker is open")
-
-            # Refill tokens based on time elapsed
-            now = time.monotonic()
-            elapsed = now - self._last_update
-            self._tokens = min(
-                float(self.burst_size),
-                self._tokens + elapsed * self._current_rps,
-            )
-            self._last_update = now
-
-            # Wait if no tokens available
-            if self._tokens < 1.0:
-                wait_time = (1.0 - self._tokens) / self._current_rps
-                self._stats.requests_throttled += 1
-                await asyncio.sleep(wait_time)
-                self._tokens = 0.0
+        self._stats.requests_total += 1
+        now = time.monotonic()
+
+        # Check circuit breaker
+        if self._circuit_state == CircuitState.OPEN:
+            if now > self._recovery_deadline:
+                self._start_probing(now)
             else:
-                self._tokens -= 1.0
+                self._stats.requests_throttled += 1
+                raise RuntimeError("Circuit breaker is open")
 
+        # Half-open lets only a few probes through; everyone else is
+        # turned away until they report back
+        if self._circuit_state == CircuitState.HALF_OPEN:
+            if self._probes_in_flight >= self.success_threshold:
+                if now <= self._recovery_deadline:
+                    self._stats.requests_throttled += 1
+                    raise RuntimeError("Circuit breaker is half-open")
+                self._start_probing(now)
+            self._probes_in_flight += 1
+
+        # Refill tokens based on time elapsed and take one in the same step,
+        # going into debt if the bucket is empty; the debt is how long this
+        # caller has to wait for its turn
+        rps = self._current_rps
+        tokens = min(
+            float(self.burst_size),
+            self._tokens + (now - self._last_update) * rps,
+        ) - 1.0
+        self._tokens = tokens
+        self._last_update = now
+
+        if tokens >= 0.0:
             self._stats.requests_allowed += 1
+            if now - self._bucket_start >= 1.0:
+                self._roll_buckets(now)
+            self._rps_buckets[-1] += 1
+            return
+        wait_time = -tokens / rps
+        self._stats.requests_throttled += 1
+
+        # Waiters sleep in parallel, each until its own slot
+        await asyncio.sleep(wait_time)
+        if self._circuit_state == CircuitState.OPEN:
+            raise RuntimeError("Circuit breaker is open")
+        self._stats.requests_allowed += 1
+        self._roll_buckets(time.monotonic())
+        self._rps_buckets[-1] += 1
+
+    def _roll_buckets(self, now: float) -> None:
+        """Start a fresh bucket for each whole second since the current one began."""
+        elapsed = int(now - self._bucket_start)
+        if elapsed:
+            self._rps_buckets.extend([0] * min(elapsed, len(self._rps_buckets)))
+            self._bucket_start += elapsed
+
+    def _start_probing(self, now: float) -> None:
+        """Move to half-open with a fresh set of probe slots."""
+        self._circuit_state = CircuitState.HALF_OPEN
+        self._consecutive_successes = 0
+        self._probes_in_flight = 0
+        self._recovery_deadline = now + self.recovery_timeout
 
     async def on_success(self) -> None:
         """Called on successful request - gradually increase rate."""
-        async with self._lock:
-            self._consecutive_errors = 0
-            self._consecutive_successes += 1
-
-            # Check if we can close circuit
-            if self._circuit_state == CircuitState.HALF_OPEN:
-                if self._consecutive_successes >= self.success_threshold:
-                    self._circuit_state = CircuitState.CLOSED
-                    self._consecutive_successes = 0
-
-            # Gradually increase rate (10% per success, capped)
-            if self._current_rps < self.max_rps:
-                self._current_rps = min(self.max_rps, self._current_rps * 1.1)
-                self._stats.current_rps = self._current_rps
+        self._consecutive_errors = 0
+        self._consecutive_successes += 1
+
+        # Check if we can close circuit
+        if self._circuit_state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            if self._consecutive_successes >= self.success_threshold:
+                self._circuit_state = CircuitState.CLOSED
+                self._consecutive_successes = 0
+
+        # Gradually increase rate (10% per success, capped)
+        if self._current_rps < self.max_rps:
+            self._current_rps = min(self.max_rps, self._current_rps * 1.1)
+            self._stats.current_rps = self._current_rps
 
     async def on_rate_limit(self) -> None:
         """Called when rate limit is hit (429) - halve the rate."""
-        async with self._lock:
-            self._stats.rate_limit_hits += 1
-            self._consecutive_errors += 1
+        self._stats.rate_limit_hits += 1
+        self._consecutive_errors += 1
+        if self._circuit_state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
 
-            # Halve the rate, respect minimum
-            self._current_rps = max(self.min_rps, self._current_rps * 0.5)
-            self._stats.current_rps = self._current_rps
+        # Halve the rate, respect minimum
+        self._current_rps = max(self.min_rps, self._current_rps * 0.5)
+        self._stats.current_rps = self._current_rps
 
-            # Check if we should open circuit
-            await self._check_circuit()
+        # Check if we should open circuit
+        self._check_circuit()
 
     async def on_error(self) -> None:
         """Called on request error - reduce rate and check circuit."""
-        async with self._lock:
-            self._stats.errors_total += 1
-            self._consecutive_errors += 1
-            self._consecutive_successes = 0
+        self._stats.errors_total += 1
+        self._consecutive_errors += 1
+        self._consecutive_successes = 0
+        if self._circuit_state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
 
-            # Reduce rate by 20%
-            self._current_rps = max(self.min_rps, self._current_rps * 0.8)
-            self._stats.current_rps = self._current_rps
+        # Reduce rate by 20%
+        self._current_rps = max(self.min_rps, self._current_rps * 0.8)
+        self._stats.current_rps = self._current_rps
+
+        # Check if we should open circuit
+        self._check_circuit()
 
-            # Check if we should open circuit
-            await self._check_circuit()
+    async def on_cancel(self) -> None:
+        """Called when an admitted request is cancelled before it reports back."""
+        if self._circuit_state == CircuitState.HALF_OPEN:
+            self._probes_in_flight = max(0, self._probes_in_flight - 1)
 
-    async def _check_circuit(self) -> None:
+    def _check_circuit(self) -> None:
         """Check if circuit breaker should open."""
         if self._consecutive_errors >= self.error_threshold:
             if self._circuit_state != CircuitState.OPEN:
                 self._circuit_state = CircuitState.OPEN
-                self._circuit_opened_at = time.monotonic()
+                # Jitter keeps limiters that tripped together from all
+                # probing the API at the same instant
+                self._recovery_deadline = time.monotonic() + self.recovery_timeout * (
+                    random.uniform(0.8, 1.2)
+                )
                 self._stats.circuit_opens += 1
                 self._stats.circuit_state = CircuitState.OPEN
 
     @property
     def stats(self) -> RateLimiterStats:
         """Get current statistics."""
+        self._roll_buckets(time.monotonic())
+        self._stats.achieved_rps = sum(self._rps_buckets) / len(self._rps_buckets)
         self._stats.circuit_state = self._circuit_state
         return self._stats
 
@@ -237,7 +300,9 @@ class SemaphoreRateLimiter:
     """Simple semaphore-based concurrency limiter."""
 
     def __init__(self, max_concurrent: int = 50):
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Bounded so a release without a matching acquire raises instead of
+        # silently raising the concurrency cap
+        self._semaphore = asyncio.BoundedSemaphore(max_concurrent)
         self._stats = RateLimiterStats()
 
     async def acquire(self) -> None:
@@ -245,7 +310,7 @@ class SemaphoreRateLimiter:
         await self._semaphore.acquire()
         self._stats.requests_allowed += 1
 
-    async def release(self) -> None:
+    def release(self) -> None:
         self._semaphore.release()
 
     async def on_success(self) -> None:
@@ -259,6 +324,9 @@ class SemaphoreRateLimiter:
         self._stats.errors_total += 1
         self.release()
 
+    async def on_cancel(self) -> None:
+        self.release()
+
     @property
     def stats(self) -> RateLimiterStats:
         return self._stats
@@ -268,4 +336,4 @@ class SemaphoreRateLimiter:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.release()
+        self.release()
@@ -64,6 +64,12 @@ class SerpSettings(BaseSettings):
         le=200,
         description="Default concurrent requests",
     )
+    global_max_inflight: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Maximum in-flight requests across all concurrent queries",
+    )
 
     # API polling configuration
     poll_interval: float = Field(
@@ -84,6 +90,12 @@ class SerpSettings(BaseSettings):
         le=120.0,
         description="HTTP request timeout in seconds",
     )
+    connect_timeout: float = Field(
+        default=5.0,
+        ge=0.5,
+        le=60.0,
+        description="Seconds to wait for a connection to the API host",
+    )
 
     # Retry configuration
     max_retries: int = Field(
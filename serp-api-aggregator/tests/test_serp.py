@@ -6,6 +6,7 @@ import argparse
 import time
 from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlsplit
 
 import serp
 from serp import SerpAggregator
@@ -29,9 +30,9 @@ async def test_basic() -> list[TestResult]:
 
     # Test 1: Single search with defaults
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         result = await client.search("python tutorial", max_pages=3, use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         passed = result.organic_count > 0 and not result.has_errors
         results.append(TestResult(
@@ -43,9 +44,9 @@ async def test_basic() -> list[TestResult]:
 
     # Test 2: Search with localization
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         result = await client.search("news", max_pages=1, country="uk", language="en", use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         passed = result.organic_count > 0
         results.append(TestResult(
@@ -88,9 +89,9 @@ async def test_batch() -> list[TestResult]:
 
     # Test 1: Sequential batch
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         batch = await client.search_batch(queries, max_pages=2, use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         passed = batch.success_count == len(queries)
         results.append(TestResult(
@@ -102,9 +103,9 @@ async def test_batch() -> list[TestResult]:
 
     # Test 2: Parallel batch
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         batch = await client.search_parallel(queries, max_pages=2, max_parallel_queries=3, use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         passed = batch.success_count == len(queries)
         results.append(TestResult(
@@ -126,13 +127,13 @@ async def test_pagination() -> list[TestResult]:
     results = []
 
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         result = await client.search(
             "machine learning tutorial",
             max_pages=30,
             use_cache=False
         )
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         passed = result.pages_fetched >= 15
         results.append(TestResult(
@@ -157,10 +158,10 @@ async def test_concurrency() -> list[TestResult]:
     queries = [f"test query {i}" for i in range(5)]
 
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         for q in queries:
             await client.search(q, max_pages=1, use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         throughput = len(queries) / duration
         results.append(TestResult(
@@ -174,9 +175,9 @@ async def test_concurrency() -> list[TestResult]:
     queries = [f"concurrent test {i}" for i in range(10)]
 
     async with SerpAggregator() as client:
-        start = time.time()
+        start = time.perf_counter()
         batch = await client.search_parallel(queries, max_pages=1, max_parallel_queries=10, use_cache=False)
-        duration = time.time() - start
+        duration = time.perf_counter() - start
 
         throughput = batch.success_count / duration
         passed = batch.success_count >= 8
@@ -205,8 +206,8 @@ async def test_consistency() -> list[TestResult]:
         await asyncio.sleep(2)
         result2 = await client.search(query, max_pages=1, use_cache=False)
 
-        domains1 = [r.link.split('/')[2] if '/' in r.link else r.link for r in result1.organic[:5]]
-        domains2 = [r.link.split('/')[2] if '/' in r.link else r.link for r in result2.organic[:5]]
+        domains1 = [urlsplit(r.link).netloc or r.link for r in result1.organic[:5]]
+        domains2 = [urlsplit(r.link).netloc or r.link for r in result2.organic[:5]]
 
         matches = sum(1 for d1, d2 in zip(domains1, domains2) if d1 == d2)
         consistency = matches / min(len(domains1), len(domains2), 5) * 100 if domains1 else 0